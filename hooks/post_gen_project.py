@@ -1,45 +1,28 @@
-"""Post generation script to install data science packages using uv."""
+"""Post generation script to install the project dependencies using uv."""
 
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
 from random import choice
 from typing import Optional
 
-# Define the root folder as the current working directory
-root_folder: Path = Path.cwd()
-
-other_packages = ["pydantic", "pydantic-settings", "cool-styles"]
-
-# Lists of packages to install
-data_science_packages = [
-    "matplotlib",
-    "numpy",
-    "openpyxl",
-    "pandas",
-    "scikit-learn",
-    "scipy",
-    "seaborn",
-    "statsmodels",
-]
-
-dev_packages = [
-    "ipykernel",
-    "tqdm",
-]
+VSCODE_SUBDIR = ".vscode"
+SETTINGS_FILENAME = "settings.json"
+SKIP_LOCK_ENV_VAR = "COOKIECUTTER_TEST_SKIP_LOCK"
+TITLEBAR_COLORS = ("#001524", "#15616d", "#ffecd1", "#ff7d00", "#78290f")
 
 
 def customize_titlebar_color(color_to_use: Optional[str] = None) -> None:
     """Customize the titlebar of VSCode."""
-    possible_colors = ["#001524", "#15616d", "#ffecd1", "#ff7d00", "#78290f"]
-    if not color_to_use:
-        color_to_use = choice(possible_colors)
+    color_to_use = color_to_use or choice(TITLEBAR_COLORS)
 
-    vscode_folder: Path = root_folder.joinpath(".vscode")
+    # The hook runs from the root of the generated project
+    vscode_folder: Path = Path.cwd() / VSCODE_SUBDIR
     vscode_folder.mkdir(exist_ok=True, parents=True)
 
-    vscode_workspace_settings = vscode_folder.joinpath("settings.json")
+    vscode_workspace_settings = vscode_folder / SETTINGS_FILENAME
     settings = {
         "workbench.colorCustomizations": {
             "titleBar.inactiveBackground": color_to_use,
@@ -47,22 +30,24 @@ def customize_titlebar_color(color_to_use: Optional[str] = None) -> None:
         }
     }
 
-    with vscode_workspace_settings.open("w") as f:
-        json.dump(settings, f, indent=4)
+    vscode_workspace_settings.write_text(json.dumps(settings, indent=4))
 
 
-def install_packages(packages: list[str], dev: bool = False):
-    """Install packages using uv."""
-    try:
-        commands = ["uv", "add"]
-        if dev:
-            commands.append("--dev")
-        commands.extend(packages)
+def sync_environment() -> None:
+    """Create the virtual environment and install the dependencies using uv.
+
+    When ``COOKIECUTTER_TEST_SKIP_LOCK`` is set to ``1`` only an empty
+    ``uv.lock`` is created, so test suites can skip the dependency resolution.
+    """
+    if os.environ.get(SKIP_LOCK_ENV_VAR) == "1":
+        Path("uv.lock").touch()
+        return
 
+    try:
         subprocess.run(
-            args=commands,
+            args=["uv", "sync"],
             check=True,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
         )
     except subprocess.CalledProcessError as e:
         print(f"Error installing packages: {e}", file=sys.stderr)
@@ -73,13 +58,7 @@ def main():
     """Main function to execute post-generation tasks."""
     if "{{cookiecutter.setup_environment}}" == "y":
         print("Installing packages...")
-        install_packages(data_science_packages)
-
-        print("Installing packages...")
-        install_packages(other_packages)
-
-        print("Installing dev packages...")
-        install_packages(dev_packages, dev=True)
+        sync_environment()
     else:
         print("Not setting up the environment...")
 
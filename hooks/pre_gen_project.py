@@ -1,10 +1,11 @@
 """Pre generation script for validating cookiecutter parameters."""
 
+import os
 import re
 import sys
+import threading
 import urllib.error
 import urllib.request
-from urllib.parse import quote
 
 # Get cookiecutter parameters
 repo_name = "{{ cookiecutter.repo_name }}"
@@ -16,7 +17,12 @@ setup_environment = "{{ cookiecutter.setup_environment }}"
 # Constants
 MAX_DESCRIPTION_LENGTH = 100
 PYPI_API_URL = "https://pypi.org/pypi/{package}/json"
+PYPI_TIMEOUT = 2.0
 MIN_PYTHON_VERSION = (3, 12)
+REPO_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$", re.ASCII)
+REPO_NAME_CHARS_RE = re.compile(r"^[a-zA-Z0-9_]+$", re.ASCII)
+PROBLEMATIC_PATH_CHARS = frozenset('/\\:*?"<>|')
+EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", re.ASCII)
 
 
 def error(message: str) -> None:
@@ -52,19 +58,21 @@ def validate_repo_name(name: str) -> None:
         error("Repository name cannot be empty")
 
     # Check if repo_name follows Python package naming conventions
-    # (alphanumeric with underscores, no hyphens)
-    if not re.match(r"^[a-zA-Z0-9_]+$", name):
+    # (alphanumeric with underscores, no hyphens, not starting with a digit)
+    if REPO_NAME_RE.match(name):
+        return
+
+    # The name is invalid: find out which rule it breaks to report it
+    if not REPO_NAME_CHARS_RE.match(name):
         error(
             f"Repository name '{name}' is not valid. "
             "It must contain only letters, numbers, and underscores."
         )
 
-    # Check if repo_name starts with a letter or underscore (as per Python conventions)
-    if not re.match(r"^[a-zA-Z_]", name):
-        error(
-            f"Repository name '{name}' is not valid. "
-            "It must start with a letter or underscore."
-        )
+    error(
+        f"Repository name '{name}' is not valid. "
+        "It must start with a letter or underscore."
+    )
 
 
 def validate_project_name(name: str) -> None:
@@ -81,13 +89,12 @@ def validate_project_name(name: str) -> None:
         error("Project name cannot be empty")
 
     # Check for characters that might cause issues in file paths
-    problematic_chars = ["/", "\\", ":", "*", "?", '"', "<", ">", "|"]
-    for char in problematic_chars:
-        if char in name:
-            warning(
-                f"Project name '{name}' contains character '{char}' "
-                "which might cause issues in file paths"
-            )
+    found_chars = PROBLEMATIC_PATH_CHARS.intersection(name)
+    if found_chars:
+        warning(
+            f"Project name '{name}' contains characters {sorted(found_chars)} "
+            "which might cause issues in file paths"
+        )
 
 
 def validate_author_email(email: str) -> None:
@@ -104,7 +111,7 @@ def validate_author_email(email: str) -> None:
         return  # Email is optional
 
     # Simple email validation using regex
-    if not re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", email):
+    if not EMAIL_RE.match(email):
         error(f"Author email '{email}' is not a valid email address")
 
 
@@ -158,6 +165,9 @@ def check_python_version() -> None:
 def check_pypi_name_conflict(name: str) -> None:
     """Check if the repository name already exists in PyPI.
 
+    The check is skipped when the ``COOKIECUTTER_OFFLINE`` environment
+    variable is set.
+
     Args:
         name: The repository name to check
 
@@ -165,12 +175,16 @@ def check_pypi_name_conflict(name: str) -> None:
     ------
         SystemExit: If name already exists in PyPI
     """
+    if os.environ.get("COOKIECUTTER_OFFLINE"):
+        return
+
     try:
-        # URL encode the package name for safety
-        encoded_name = quote(name)
-        url = PYPI_API_URL.format(package=encoded_name)
+        # validate_repo_name already restricted the name to URL-safe characters
+        url = PYPI_API_URL.format(package=name)
 
-        with urllib.request.urlopen(url) as response:
+        # Only the status code matters, so skip downloading the JSON body
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=PYPI_TIMEOUT) as response:
             if response.status == 200:
                 warning(
                     f"Repository name '{name}' already exists in PyPI. "
@@ -198,6 +212,13 @@ def main() -> None:
 
     # Validate required parameters
     validate_repo_name(repo_name)
+
+    # Query PyPI in the background while the remaining checks run
+    pypi_check = threading.Thread(
+        target=check_pypi_name_conflict, args=(repo_name,), daemon=True
+    )
+    pypi_check.start()
+
     validate_project_name(project_name)
     validate_author_email(author_email)
     validate_description(description)
@@ -205,7 +226,10 @@ def main() -> None:
 
     # Additional checks
     check_python_version()
-    check_pypi_name_conflict(repo_name)
+
+    pypi_check.join(timeout=PYPI_TIMEOUT)
+    if pypi_check.is_alive():
+        warning("Could not check PyPI for package name conflicts: request timed out")
 
     print("All parameters are valid!")
 
@@ -0,0 +1,24 @@
+"""Configuration for pytest."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def uv_environment():
+    """Configure the uv runs triggered by the post generation hook.
+
+    UV_CACHE_DIR is deliberately left untouched: every render and every xdist
+    worker shares the user cache, which CI can persist between runs, so the
+    resolver only hits the network when it is cold.
+
+    The tests only check that uv.lock exists, so the hook is told to skip the
+    dependency resolution unless COOKIECUTTER_TEST_SKIP_LOCK is already set
+    (e.g. to 0, to exercise the real uv sync).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("UV_NO_PROGRESS", "1")
+        if "COOKIECUTTER_TEST_SKIP_LOCK" not in os.environ:
+            mp.setenv("COOKIECUTTER_TEST_SKIP_LOCK", "1")
+        yield
@@ -1,133 +1,165 @@
-from pathlib import Path  # noqa: D100
+import os  # noqa: D100
+import shutil
+from pathlib import Path
 
 import pytest
 from cookiecutter.main import cookiecutter
 
+# The pre_prompt hook aborts every render when uv is missing
+pytestmark = pytest.mark.skipif(shutil.which("uv") is None, reason="uv is not installed")
+
 template_directory: Path = Path(__file__).parents[1].resolve()
 
+project_contexts: dict[str, dict[str, str]] = {
+    "explicit-email": {
+        "repo_git_ssh_url": "",
+        "project_name": "my statistical project",
+        "repo_name": "",
+        "author_name": "giuseppe minardi",
+        "author_email": "giuseppe.minardi@gmail.com",
+        "description": "test description",
+        "version": "0.0.0",
+        "setup_environment": "n",
+    },
+    "derived-email": {
+        "repo_git_ssh_url": "",
+        "project_name": "my statistical project",
+        "repo_name": "",
+        "author_name": "Mario Rossi",
+        "author_email": "",
+        "description": "test description",
+        "version": "0.0.0",
+        "setup_environment": "n",
+    },
+    "setup-environment": {
+        "repo_git_ssh_url": "",
+        "project_name": "my statistical project",
+        "repo_name": "",
+        "author_name": "Mario Rossi",
+        "author_email": "",
+        "description": "test description",
+        "version": "0.0.0",
+        "setup_environment": "y",
+    },
+}
 
-@pytest.mark.parametrize(
-    argnames=[
-        "repo_git_ssh_url",
-        "project_name",
-        "repo_name",
-        "author_name",
-        "author_email",
-        "description",
-        "version",
-        "setup_environment",
-    ],
-    argvalues=[
-        (
-            "",
-            "my statistical project",
-            "",
-            "giuseppe minardi",
-            "giuseppe.minardi@gmail.com",
-            "test description",
-            "0.0.0",
-            "n",
-        ),
-        (
-            "",
-            "my statistical project",
-            "",
-            "Mario Rossi",
-            "",
-            "test description",
-            "0.0.0",
-            "n",
-        ),
-        (
-            "",
-            "my statistical project",
-            "",
-            "Mario Rossi",
-            "",
-            "test description",
-            "0.0.0",
-            "y",
-        ),
+expected_dirs: frozenset[str] = frozenset(
+    {
+        ".vscode",
+        ".github",
+        ".github/workflows",
+        "data",
+        "data/external",
+        "data/processed",
+        "data/raw",
+        "data/interim",
+        "logs",
+        "notebooks",
+        "report",
+        "report/figures",
+        "report/tables",
+        "src",
+    }
+)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        # Keep every test of a case on the same xdist worker so it renders once
+        pytest.param(context, id=case, marks=pytest.mark.xdist_group(case))
+        for case, context in project_contexts.items()
     ],
 )
-def test_project_creation(  # noqa: D103
-    tmp_path: Path,
-    repo_git_ssh_url: str,
-    project_name: str,
-    repo_name: str,
-    author_name: str,
-    author_email: str,
-    description: str,
-    version: str,
-    setup_environment: str,
-):
-    if not repo_name and repo_git_ssh_url:
-        repo_name = repo_git_ssh_url.split("/")[-1].replace(".git", "") 
-    elif not repo_name and not repo_git_ssh_url:
-        repo_name = project_name.replace(" ", "_").lower()
-    
-    if not author_email:
-        author_email = author_name.title().replace(" ", "") + "@gmail.com"
+def project_context(request: pytest.FixtureRequest) -> dict[str, str]:
+    """Cookiecutter context with the defaults of cookiecutter.json filled in."""
+    context = dict(request.param)
+    if not context["repo_name"] and context["repo_git_ssh_url"]:
+        context["repo_name"] = (
+            context["repo_git_ssh_url"].split("/")[-1].replace(".git", "")
+        )
+    elif not context["repo_name"]:
+        context["repo_name"] = context["project_name"].replace(" ", "_").lower()
+
+    if not context["author_email"]:
+        context["author_email"] = (
+            context["author_name"].title().replace(" ", "") + "@gmail.com"
+        )
+    return context
 
+
+@pytest.fixture(scope="module")
+def rendered_project(
+    tmp_path_factory: pytest.TempPathFactory, project_context: dict[str, str]
+) -> Path:
+    """Render the template once per context and return the project folder."""
+    output_dir = tmp_path_factory.mktemp("rendered")
     cookiecutter(
         template=template_directory.as_posix(),
-        output_dir=str(tmp_path),
+        output_dir=str(output_dir),
         no_input=True,
-        extra_context={
-            "repo_git_ssh_url": repo_git_ssh_url,
-            "project_name": project_name,
-            "repo_name": repo_name,
-            "author_name": author_name,
-            "author_email": author_email,
-            "description": description,
-            "version": version,
-            "setup_environment": setup_environment,
-        },
+        extra_context=project_context,
     )
+    return output_dir.joinpath(project_context["repo_name"])
+
+
+def _collect_dirs(root: Path, max_depth: int = 2) -> set[str]:
+    """Collect the POSIX paths, relative to root, of directories up to max_depth.
+
+    The depth limit keeps the walk away from the content of .venv and .git.
+    """
+    found: set[str] = set()
+    stack = [(os.fspath(root), "", 1)]
+    while stack:
+        path, prefix, depth = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    rel_path = f"{prefix}{entry.name}"
+                    found.add(rel_path)
+                    if depth < max_depth:
+                        stack.append((entry.path, f"{rel_path}/", depth + 1))
+    return found
+
+
+def test_project_structure(rendered_project: Path):  # noqa: D103
+    assert rendered_project.is_dir()
 
-    created_repo_path = tmp_path.joinpath(repo_name)
-    assert created_repo_path.is_dir()
-
-    expected_dirs = [
-        [".vscode"],
-        [".github"],
-        [".github/workflows"],
-        ["data"],
-        ["data", "external"],
-        ["data", "processed"],
-        ["data", "raw"],
-        ["data", "interim"],
-        ["logs"],
-        ["notebooks"],
-        ["report"],
-        ["report", "figures"],
-        ["report", "tables"],
-        ["src"],
-    ]
-
-    for rel_path in expected_dirs:
-        folder = created_repo_path.joinpath(*rel_path)
-        assert folder.is_dir(), f"Expected directory {folder} is missing or not a directory"
-
-    with created_repo_path.joinpath("README.md").open("r") as f:
-        readme = f.read()
-        assert project_name in readme
-        assert description in readme
-
-    with created_repo_path.joinpath("pyproject.toml").open("r") as f:
-        pyproject = f.read()
-        assert author_name in pyproject
-        assert author_email in pyproject
-        assert description in pyproject
-        assert version in pyproject
-    
-    with created_repo_path.joinpath("report", "report.tex").open("r") as f:
-        report = f.read()
-        assert author_name in report
-        assert description in report
-
-    uv_lock = created_repo_path.joinpath("uv.lock")
-    if setup_environment == "y":
+    present = _collect_dirs(rendered_project)
+    missing = expected_dirs - present
+    assert not missing, f"Expected directories {sorted(missing)} are missing"
+
+
+def test_readme_content(  # noqa: D103
+    rendered_project: Path, project_context: dict[str, str]
+):
+    readme = (rendered_project / "README.md").read_text(encoding="utf-8")
+    assert project_context["project_name"] in readme
+    assert project_context["description"] in readme
+
+
+def test_pyproject_content(  # noqa: D103
+    rendered_project: Path, project_context: dict[str, str]
+):
+    pyproject = (rendered_project / "pyproject.toml").read_text(encoding="utf-8")
+    expected = ("author_name", "author_email", "description", "version")
+    missing = [key for key in expected if project_context[key] not in pyproject]
+    assert not missing, f"pyproject.toml is missing {missing}"
+
+
+def test_report_content(  # noqa: D103
+    rendered_project: Path, project_context: dict[str, str]
+):
+    report = (rendered_project / "report" / "report.tex").read_text(encoding="utf-8")
+    assert project_context["author_name"] in report
+    assert project_context["description"] in report
+
+
+def test_uv_lock(  # noqa: D103
+    rendered_project: Path, project_context: dict[str, str]
+):
+    uv_lock = rendered_project.joinpath("uv.lock")
+    if project_context["setup_environment"] == "y":
         assert uv_lock.is_file()
     else:
         assert not uv_lock.exists()
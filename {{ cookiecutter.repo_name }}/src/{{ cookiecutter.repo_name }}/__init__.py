@@ -2,16 +2,81 @@
 
 Expose the most useful symbols from the package so notebooks can import
 directly from the package without modifying `sys.path`.
+
+The symbols are loaded on first access (PEP 562): importing the package, or
+only its configuration classes, neither imports pydantic nor configures
+logging until they are needed. Logging is configured the first time
+`logger` is accessed.
 """
 
+import atexit
 import logging
+import threading
+
+__all__ = ["LoggerConfiguration", "ProjectPaths", "logger"]
+
+# Held while logging is configured, so that it is configured only once
+_logger_lock = threading.Lock()
+
+
+def _configure_logging() -> logging.Logger:
+    """Configure logging for the project and return the project logger.
+
+    Returns
+    -------
+        The project logger, set to the configured log level.
+    """
+    import logging.config
+    import logging.handlers
+
+    from .project_configs import LoggerConfiguration, ProjectPaths
+
+    project_paths = ProjectPaths()
+    logger_config = LoggerConfiguration()
+
+    # Unless asked for, skip the thread and process lookups made for every record
+    logging.logThreads = logger_config.capture_thread_info
+    logging.logProcesses = logger_config.capture_thread_info
+    logging.logMultiprocessing = logger_config.capture_thread_info
+    logging.logAsyncioTasks = (  # type: ignore[attr-defined]
+        logger_config.capture_thread_info
+    )
+
+    loggerdict_config = logger_config.generate(log_dir=project_paths.logger_folder)
+    logging.config.dictConfig(loggerdict_config)
+
+    # Console and file output happen on the queue listener thread
+    queue_handler = logging.getHandlerByName("queue")
+    if (
+        not isinstance(queue_handler, logging.handlers.QueueHandler)
+        or queue_handler.listener is None
+    ):
+        raise RuntimeError(
+            "The logging configuration has no 'queue' QueueHandler with handlers"
+        )
+    queue_listener = queue_handler.listener
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+
+    logger = logging.getLogger(logger_config.log_name)
+    logger.setLevel(logger_config.log_level)
+    return logger
 
-from .project_configs import LoggerConfiguration, ProjectPaths
 
-_project_paths = ProjectPaths()
-_logger_config = LoggerConfiguration()
-_loggerdict_config = _logger_config.generate(log_dir=_project_paths.logger_folder)
-logger = logging.getLogger(_logger_config.log_name)
-logger.setLevel(_logger_config.log_level)
+def __getattr__(name: str):
+    """Load the public symbols of the package on first access."""
+    if name == "logger":
+        with _logger_lock:
+            # Another thread may have configured logging while this one waited
+            if "logger" not in globals():
+                globals()["logger"] = _configure_logging()
+        return globals()["logger"]
+    if name in __all__:
+        from . import project_configs
 
-__all__ = ["ProjectPaths", "logger"]
\ No newline at end of file
+        value = getattr(project_configs, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the symbol so that later lookups skip this function
+    globals()[name] = value
+    return value
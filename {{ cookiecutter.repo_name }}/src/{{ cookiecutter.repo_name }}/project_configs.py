@@ -10,19 +10,29 @@ The module contains:
 - `DataFolderSettings`: Configuration for data directories (raw, processed, etc.).
 - `ReportFolderSettings`: Configuration for report-related directories.
 - `ProjectPaths`: Centralized access to all project folder settings.
+- `FastFormatter`: Formatter caching the per-record work of the standard one.
+- `FormatOnceQueueListener`: Queue listener formatting each record once.
+- `FastRotatingFileHandler`: Buffered, size-based rotating file handler for the logs.
 - `LoggerConfiguration`: Logging configuration for the project.
 
 All settings classes automatically validate paths and provide default
 subfolder creation logic based on a given root folder.
 """
 
+import codecs
+import logging
+import os
+import time
 from datetime import datetime
+from functools import cached_property
+from logging.handlers import QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from pydantic import (
     DirectoryPath,
     Field,
     PositiveInt,
+    computed_field,
     field_serializer,
     model_validator,
 )
@@ -31,6 +41,48 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
+# Root of the generated project: src/<package>/project_configs.py -> parents[2]
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Loggers hand records to the queue handler, its listener feeds the outputs
+_QUEUE_HANDLERS = ("queue",)
+_OUTPUT_HANDLERS = ("console", "file")
+
+# Encoded as is by ASCII-compatible codecs, `+` and `~` catch utf-7 and the like
+_ASCII_PROBE = "".join(map(chr, range(128)))
+
+
+def _populate_subfolders(
+    values: dict, root_field: str, subfolders: tuple[str, ...]
+) -> dict:
+    """Populate the missing subfolder paths from a root folder.
+
+    Args:
+        values: Dictionary of field values to validate.
+        root_field: Name of the field holding the root folder.
+        subfolders: Names of the subfolder fields to populate.
+
+    Returns
+    -------
+        Validated values dictionary with default subfolders populated.
+
+    Raises
+    ------
+        ValueError: If the root folder is missing or invalid type.
+    """
+    root_folder: str | Path | None = values.get(root_field)
+    if not root_folder:
+        raise ValueError(f"{root_field} folder cannot be None")
+    elif isinstance(root_folder, str):
+        root_folder = Path(root_folder)
+    elif not isinstance(root_folder, Path):
+        raise ValueError(f"{root_field} folder can only be of type str or Path.")
+
+    for folder_name in subfolders:
+        if not values.get(folder_name):
+            values[folder_name] = root_folder.joinpath(folder_name)
+    return values
+
 
 class DataFolderSettings(BaseSettings):
     """
@@ -89,21 +141,9 @@ class DataFolderSettings(BaseSettings):
         ------
             ValueError: If data_root is missing or invalid type.
         """
-        root_folder: str | Path | None = values.get("data_root")
-        if not root_folder:
-            raise ValueError("Root folder should be present.")
-
-        if not root_folder:
-            raise ValueError("data_root folder cannot be None")
-        elif isinstance(root_folder, str):
-            root_folder = Path(root_folder)
-        elif not isinstance(root_folder, Path):
-            raise ValueError("Data root folder can only be of type str or Path.")
-
-        for folder_name in ["external", "interim", "processed", "raw"]:
-            if not values.get(folder_name):
-                values[folder_name] = root_folder.joinpath(folder_name)
-        return values
+        return _populate_subfolders(
+            values, "data_root", ("external", "interim", "processed", "raw")
+        )
 
 
 class ReportFolderSettings(BaseSettings):
@@ -126,7 +166,7 @@ class ReportFolderSettings(BaseSettings):
         default=None, description="Folder containing the tables"
     )
 
-    @field_serializer("*", when_used="json")
+    @field_serializer("report_root", "figures", "tables", when_used="json")
     def paths_serializer(self, path: Path | None) -> str | None:
         """Serialize Path objects to POSIX-formatted strings.
         
@@ -155,18 +195,7 @@ class ReportFolderSettings(BaseSettings):
         ------
             ValueError: If report_root is missing or invalid type.
         """
-        root_folder: str | Path | None = values.get("report_root")
-        if not root_folder:
-            raise ValueError("report_root folder cannot be None")
-        elif isinstance(root_folder, str):
-            root_folder = Path(root_folder)
-        elif not isinstance(root_folder, Path):
-            raise ValueError("Report root folder can only be of type str or Path.")
-
-        for folder_name in ["figures", "tables"]:
-            if not values.get(folder_name):
-                values[folder_name] = root_folder.joinpath(folder_name)
-        return values
+        return _populate_subfolders(values, "report_root", ("figures", "tables"))
 
 
 class ProjectPaths(BaseSettings):
@@ -174,33 +203,260 @@ class ProjectPaths(BaseSettings):
     Configuration for project-level paths and directories.
     
     Centralizes access to all project folder settings including data, reports,
-    and logs directories. Automatically initializes default data and report
-    folder configurations based on the project root directory.
+    and logs directories. The data and report folder configurations are built
+    from the project root directory the first time they are accessed.
     """
     
-    root: DirectoryPath = Path(__file__).resolve().parents[2]
+    root: DirectoryPath = _PROJECT_ROOT
     logger_folder: DirectoryPath = root.joinpath("logs")
 
-    data_folder: DataFolderSettings | None = Field(
-        default=None, description="Folder containing the data."
+    @computed_field(  # type: ignore[prop-decorator]
+        description="Folder containing the data."
     )
-    report_folder: ReportFolderSettings | None = Field(
-        default=None, description="Folder containing the reports."
+    @cached_property
+    def data_folder(self) -> DataFolderSettings:
+        """Data folder settings, validated on first access."""
+        return DataFolderSettings(data_root=self.root.joinpath("data"))
+
+    @computed_field(  # type: ignore[prop-decorator]
+        description="Folder containing the reports."
     )
+    @cached_property
+    def report_folder(self) -> ReportFolderSettings:
+        """Report folder settings, validated on first access."""
+        return ReportFolderSettings(report_root=self.root.joinpath("report"))
 
-    @model_validator(mode="before")
-    @classmethod
-    def _fill_fields(cls, values: dict) -> dict:
-        if not (root_folder := values.get("root")):
-            root_folder = Path(__file__).resolve().parents[2]
-            values["root"] = root_folder
-        values["data_folder"] = DataFolderSettings(
-            data_root=root_folder.joinpath("data")
+
+class FastFormatter(logging.Formatter):
+    """
+    Formatter caching the per-record work of the standard one.
+
+    For every record the standard library formatter searches the format
+    string for `%(asctime)`, goes through its style object to interpolate it
+    and renders the creation time with `strftime`. This formatter checks the
+    format string once, interpolates `%`-style formats directly and renders
+    the time once per second, which is the resolution of `strftime`.
+
+    While `FormatOnceQueueListener` dispatches a record, the formatter
+    reuses the text of that record for every handler sharing it.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._uses_time = self._style.usesTime()
+        # Other styles, and `defaults`, need the style object to interpolate
+        self._percent_fmt = (
+            self._style._fmt
+            if type(self._style) is logging.PercentStyle and not kwargs.get("defaults")
+            else None
         )
-        values["report_folder"] = ReportFolderSettings(
-            report_root=root_folder.joinpath("report")
+        self._time_cache: tuple[int | None, str] = (None, "")
+        self._reuse_text = False
+        self._dispatched: tuple[logging.LogRecord, str] | None = None
+
+    def _start_reuse(self) -> None:
+        """Reuse the text of the next formatted record until `_stop_reuse`."""
+        self._reuse_text = True
+
+    def _stop_reuse(self) -> None:
+        """Stop reusing the formatted text and drop the record it belongs to."""
+        self._reuse_text = False
+        self._dispatched = None
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record, reusing the text of the dispatched record."""
+        if not self._reuse_text:
+            return super().format(record)
+        dispatched = self._dispatched
+        if dispatched is not None and dispatched[0] is record:
+            return dispatched[1]
+        text = super().format(record)
+        self._dispatched = (record, text)
+        return text
+
+    def usesTime(self) -> bool:  # noqa: N802
+        """Check if the format uses the creation time of the record."""
+        return self._uses_time
+
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        """Interpolate the record attributes into the format string."""
+        if self._percent_fmt is None:
+            return super().formatMessage(record)
+        try:
+            return self._percent_fmt % record.__dict__
+        except KeyError as e:
+            raise ValueError(f"Formatting field not found in record: {e}") from e
+
+    def formatTime(  # noqa: N802
+        self, record: logging.LogRecord, datefmt: str | None = None
+    ) -> str:
+        """Format the creation time of the record, reusing the last second."""
+        if datefmt != self.datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            self._time_cache = (second, text)
+        if datefmt or not self.default_msec_format:
+            return text
+        return self.default_msec_format % (text, record.msecs)
+
+
+class FormatOnceQueueListener(QueueListener):
+    """
+    Queue listener formatting each record once for all of its handlers.
+
+    The standard listener offers the record to every handler, and each of
+    them formats it again even when they share the same formatter. This
+    listener lets the `FastFormatter` of its handlers reuse the text of the
+    record being dispatched. Handler filters may change the record, so the
+    text is never reused by, or after, a handler that has filters.
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Offer the record to the handlers, formatting it once if possible."""
+        record = self.prepare(record)
+        reusing: list[FastFormatter] = []
+        can_reuse = True
+        try:
+            for handler in self.handlers:
+                if self.respect_handler_level and record.levelno < handler.level:
+                    continue
+                formatter = handler.formatter
+                if handler.filters:
+                    # The filters may change the record, format it from now on
+                    can_reuse = False
+                    for reused in reusing:
+                        reused._stop_reuse()
+                    reusing.clear()
+                elif (
+                    can_reuse
+                    and isinstance(formatter, FastFormatter)
+                    and formatter not in reusing
+                ):
+                    formatter._start_reuse()
+                    reusing.append(formatter)
+                handler.handle(record)
+        finally:
+            for reused in reusing:
+                reused._stop_reuse()
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler tuned for cheap per-record writes.
+
+    For every record the standard library handler formats the message twice,
+    calls `tell` (which flushes the stream) and checks with two `stat` calls
+    that the log file is a regular file. This handler formats each record
+    once, keeps track of the size in bytes of the file itself and, as the
+    upstream CPython fix gh-105623 does, only checks the file type when the
+    record would actually push the file past `maxBytes`.
+
+    Records are written through a `buffer_size` bytes buffer which is
+    flushed only for records at or above `flush_level`, when the buffer is
+    full and when the handler is closed, instead of once per record.
+    """
+
+    def __init__(
+        self,
+        *args,
+        buffer_size: int = 65536,
+        flush_level: int = logging.WARNING,
+        **kwargs,
+    ) -> None:
+        # Set before the parent opens the stream through `_open`
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._stream_size = 0
+        self._is_closed = False
+        self._encoder = codecs.getincrementalencoder("utf-8")()
+        self._ascii_compatible = True
+        self._linesep = "\n"
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        """Open the log file with a `buffer_size` bytes write buffer."""
+        stream = self._builtin_open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
         )
-        return values
+        # Nothing is buffered yet, so this does not flush anything
+        self._stream_size = stream.tell()
+        # Resolved by `open`, e.g. to the locale encoding when not given
+        self._encoder = codecs.getincrementalencoder(stream.encoding)(stream.errors)
+        if self._stream_size:
+            # Like the stream, do not count a BOM when appending (e.g. utf-16)
+            self._encoder.setstate(0)
+        self._ascii_compatible = _ASCII_PROBE.encode(
+            stream.encoding, stream.errors
+        ) == _ASCII_PROBE.encode("ascii")
+        # The stream writes every newline as the platform line separator
+        self._linesep = os.linesep
+        return stream
+
+    def close(self) -> None:
+        """Close the log file."""
+        self._is_closed = True
+        super().close()
+
+    def _encoded_size(self, msg: str) -> int:
+        """Size in bytes of the message once written to the open log file."""
+        if self._ascii_compatible and msg.isascii():
+            if self._linesep == "\n":
+                return len(msg)
+            return len(msg) + msg.count("\n") * (len(self._linesep) - 1)
+        if self._linesep != "\n":
+            msg = msg.replace("\n", self._linesep)
+        return len(self._encoder.encode(msg))
+
+    def _should_rollover(self, msg_size: int) -> bool:
+        if self.maxBytes <= 0 or not self._stream_size:
+            # Never rollover an empty file
+            return False
+        if self._stream_size + msg_size < self.maxBytes:
+            return False
+        # Never rollover anything other than regular files
+        path = self.baseFilename
+        return not os.path.exists(path) or os.path.isfile(path)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:  # noqa: N802
+        """Determine if the record would make the log file exceed `maxBytes`."""
+        if self.stream is None:  # delay was set...
+            self.stream = self._open()
+        msg = self.format(record) + self.terminator
+        return self._should_rollover(self._encoded_size(msg))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing the buffer only for important records."""
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                # Do not reopen a file closed in "w" mode (see bpo-42378)
+                if self.mode == "w" and self._is_closed:
+                    return
+                self.stream = self._open()
+            msg_size = self._encoded_size(msg)
+            if self._should_rollover(msg_size):
+                self.doRollover()
+                if self.stream is None:  # delay was set...
+                    self.stream = self._open()
+                # Measured again in case the new file starts with a BOM
+                msg_size = self._encoded_size(msg)
+            self.stream.write(msg)
+            self._stream_size += msg_size
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class LoggerConfiguration(BaseSettings):
@@ -211,18 +467,34 @@ class LoggerConfiguration(BaseSettings):
     log_file_name: str = Field(default="{{cookiecutter.repo_name}}.log")
     max_bytes: PositiveInt = Field(default=5_000_000)
     backup_count: PositiveInt = Field(default=5)
+    multi_process_safe: bool = Field(
+        default=False,
+        description=(
+            "Lock the log file so several processes can share it. Requires the "
+            "concurrent-log-handler package and writes the logs several times "
+            "slower than the default handler."
+        ),
+    )
+    capture_thread_info: bool = Field(
+        default=False,
+        description="Record thread, process and asyncio task names in the logs.",
+    )
 
     def generate(self, log_dir: Path) -> dict:
         """Generate logging configuration dictionary."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file_name = f"{timestamp}_{self.log_file_name}"
-        log_path = log_dir / log_file_name
+        log_path = log_dir / f"{datetime.now():%Y%m%d_%H%M%S}_{self.log_file_name}"
+        file_handler_class = (
+            "concurrent_log_handler.ConcurrentRotatingFileHandler"
+            if self.multi_process_safe
+            else "{{cookiecutter.repo_name}}.project_configs.FastRotatingFileHandler"
+        )
 
         return {
             "version": 1,
             "disable_existing_loggers": False,
             "formatters": {
                 "standard": {
+                    "()": "{{cookiecutter.repo_name}}.project_configs.FastFormatter",
                     "format": "[%(asctime)s] %(levelname)s - %(name)s - %(message)s",
                     "datefmt": "%Y-%m-%d %H:%M:%S",
                 },
@@ -234,7 +506,7 @@ class LoggerConfiguration(BaseSettings):
                     "formatter": "standard",
                 },
                 "file": {
-                    "class": "logging.handlers.RotatingFileHandler",
+                    "class": file_handler_class,
                     "level": self.log_level,
                     "formatter": "standard",
                     "filename": log_path.as_posix(),
@@ -242,16 +514,23 @@ class LoggerConfiguration(BaseSettings):
                     "backupCount": self.backup_count,
                     "encoding": "utf8",
                 },
+                # Loggers only enqueue records, the listener thread writes them
+                "queue": {
+                    "class": "logging.handlers.QueueHandler",
+                    "handlers": _OUTPUT_HANDLERS,
+                    "respect_handler_level": True,
+                    "listener": "{{cookiecutter.repo_name}}.project_configs.FormatOnceQueueListener",
+                },
             },
             "root": {
                 "level": self.log_level,
-                "handlers": ["console", "file"],
+                "handlers": _QUEUE_HANDLERS,
             },
             "loggers": {
+                # Only filter the level, the root handler outputs the records
                 "matplotlib": {
                     "level": "WARNING",
-                    "handlers": ["console", "file"],
-                    "propagate": False,
+                    "propagate": True,
                 },
             },
         }
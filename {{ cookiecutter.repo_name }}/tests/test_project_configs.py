@@ -0,0 +1,177 @@
+"""Tests for the logging helpers of the project configuration."""
+
+import copy
+import functools
+import importlib
+import io
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Imported by name so that the template itself stays valid Python
+project_configs = importlib.import_module(
+    "{{ cookiecutter.repo_name }}.project_configs"
+)
+
+
+def _record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+def _rotated_sizes(log_dir: Path, msg: str, encoding: str) -> list[int]:
+    handler = project_configs.FastRotatingFileHandler(
+        log_dir / "test.log", maxBytes=1000, backupCount=10, encoding=encoding
+    )
+    for _ in range(20):
+        handler.emit(_record(msg))
+    handler.close()
+
+    sizes = [log_file.stat().st_size for log_file in sorted(log_dir.iterdir())]
+    assert len(sizes) > 1
+    assert max(sizes) <= 1000, f"Log files exceed maxBytes: {sizes}"
+    return sizes
+
+
+@pytest.mark.parametrize("msg", ["é" * 90, "e" * 90, "traceback\n" * 9])
+def test_rotation_counts_encoded_bytes(tmp_path: Path, msg: str):  # noqa: D103
+    sizes = _rotated_sizes(tmp_path, msg, "utf8")
+    assert sum(sizes) == 20 * len((msg + "\n").replace("\n", os.linesep).encode())
+
+
+@pytest.mark.parametrize("msg", ["é" * 45, "e" * 45])
+def test_rotation_counts_non_ascii_compatible_codecs(  # noqa: D103
+    tmp_path: Path, msg: str
+):
+    sizes = _rotated_sizes(tmp_path, msg, "utf-16")
+    # Each file starts with a 2 bytes BOM
+    line_size = len((msg + "\n").replace("\n", os.linesep).encode("utf-16-le"))
+    assert sum(sizes) == 20 * line_size + 2 * len(sizes)
+
+
+def test_rotation_counts_crlf_line_endings(  # noqa: D103
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # Behave as on Windows, where the text stream writes newlines as CRLF
+    monkeypatch.setattr(os, "linesep", "\r\n")
+    # FileHandler keeps the `open` it finds in the logging module globals
+    monkeypatch.setattr(
+        logging, "open", functools.partial(open, newline="\r\n"), raising=False
+    )
+    msg = "traceback\n" * 9
+    sizes = _rotated_sizes(tmp_path, msg, "utf8")
+    assert sum(sizes) == 20 * len((msg + "\n").replace("\n", "\r\n"))
+
+
+@pytest.mark.parametrize("msec_format", ["%s,%03d", "%s.%03d", None])
+@pytest.mark.parametrize("datefmt", [None, "%Y-%m-%d %H:%M:%S", "%d/%m %H:%M"])
+@pytest.mark.parametrize(
+    "fmt", ["[%(asctime)s] %(levelname)s - %(name)s - %(message)s", "%(message)s"]
+)
+def test_fast_formatter_matches_stdlib(  # noqa: D103
+    fmt: str, datefmt: str | None, msec_format: str | None
+):
+    fast = project_configs.FastFormatter(fmt, datefmt=datefmt)
+    stdlib = logging.Formatter(fmt, datefmt=datefmt)
+    fast.default_msec_format = stdlib.default_msec_format = msec_format
+
+    # Records within the same second and across seconds
+    for created in (1_700_000_000.25, 1_700_000_000.75, 1_700_000_001.5):
+        record = _record("hello %s")
+        record.args = ("world",)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        assert fast.format(record) == stdlib.format(record)
+
+
+def _redact_in_place(record: logging.LogRecord) -> bool:
+    record.msg = record.msg.replace("s3cret", "***")
+    return True
+
+
+def _redact_copy(record: logging.LogRecord) -> logging.LogRecord:
+    record = copy.copy(record)
+    record.msg = record.msg.replace("s3cret", "***")
+    return record
+
+
+def _stream_handler(formatter: logging.Formatter) -> logging.StreamHandler:
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(formatter)
+    return handler
+
+
+def test_listener_formats_once(monkeypatch: pytest.MonkeyPatch):  # noqa: D103
+    calls = []
+    stdlib_format = logging.Formatter.format
+    monkeypatch.setattr(
+        logging.Formatter,
+        "format",
+        lambda self, record: calls.append(record) or stdlib_format(self, record),
+    )
+    formatter = project_configs.FastFormatter("%(levelname)s %(message)s")
+    handlers = [_stream_handler(formatter), _stream_handler(formatter)]
+    listener = project_configs.FormatOnceQueueListener(queue.Queue(), *handlers)
+
+    record = _record("token=%s")
+    record.args = ("abc",)
+    listener.handle(record)
+
+    assert len(calls) == 1
+    assert [h.stream.getvalue() for h in handlers] == ["INFO token=abc\n"] * 2
+    assert formatter._dispatched is None
+
+
+@pytest.mark.parametrize("redact", [_redact_in_place, _redact_copy])
+@pytest.mark.parametrize("through_listener", [True, False])
+def test_filters_changing_the_record_are_honoured(  # noqa: D103
+    redact, through_listener: bool
+):
+    formatter = project_configs.FastFormatter("%(levelname)s %(message)s")
+    plain, redacted = _stream_handler(formatter), _stream_handler(formatter)
+    redacted.addFilter(redact)
+    # A handler after the filtered one sees the record as left by the filter
+    after = _stream_handler(formatter)
+
+    record = _record("token=s3cret")
+    if through_listener:
+        listener = project_configs.FormatOnceQueueListener(
+            queue.Queue(), plain, redacted, after
+        )
+        listener.handle(record)
+    else:
+        for handler in (plain, redacted, after):
+            handler.handle(record)
+
+    in_place = redact is _redact_in_place
+    expected_after = "INFO token=***\n" if in_place else "INFO token=s3cret\n"
+    assert plain.stream.getvalue() == "INFO token=s3cret\n"
+    assert redacted.stream.getvalue() == "INFO token=***\n"
+    assert after.stream.getvalue() == expected_after
+
+
+def test_logging_is_configured_once(monkeypatch: pytest.MonkeyPatch):  # noqa: D103
+    package = importlib.import_module("{{ cookiecutter.repo_name }}")
+    monkeypatch.delitem(vars(package), "logger", raising=False)
+    calls = []
+
+    def slow_configure() -> logging.Logger:
+        calls.append(None)
+        time.sleep(0.05)
+        return logging.getLogger("test")
+
+    monkeypatch.setattr(package, "_configure_logging", slow_configure)
+    threads = [
+        threading.Thread(target=getattr, args=(package, "logger")) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert package.logger is logging.getLogger("test")